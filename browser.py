@@ -2,32 +2,42 @@
 LibreX Web Browser implementation using PySide6.
 """
 
+from __future__ import annotations
+
 try:
     from PySide6.QtCore import (
-        QUrl, Qt, QObject, Signal, QRunnable, QThreadPool, QTimer
+        QUrl, Qt, QTimer, Slot
     )
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QTabWidget,
         QPushButton, QProgressBar
     )
-    from PySide6.QtWebEngineWidgets import QWebEngineView
     from PySide6.QtGui import QIcon, QKeySequence, QShortcut
 except ImportError as e:
     raise ImportError(
         "PySide6 modules could not be imported. Please install PySide6."
     ) from e
 
+import os
 import sys
+import re
 import logging
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)-8s] %(message)s",
-    datefmt="%H:%M:%S"
-)
+if TYPE_CHECKING:
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+
+logger = logging.getLogger("librex")
 
 DEFAULT_SEARCH_ENGINE = "https://duckduckgo.com"
 DEFAULT_SEARCH_ENGINE_SEARCH_PATH = "/?q="
+SEARCH_ENGINE_CONFIG_PATH = "browser/config/search_engine/search_engine.txt"
+STYLESHEET_PATH = "browser/styles/stylesheets/qss/styles.qss"
+FAVICON_PATH = "browser/assets/icons/favicons/favicon.ico"
+
+MAX_TITLE_LENGTH = 15
 
 SHORTCUTS = {
     "new_tab": "Ctrl+T",
@@ -35,144 +45,247 @@ SHORTCUTS = {
     "close_browser": "Ctrl+Shift+W"
 }
 
+# Browser method triggered by each SHORTCUTS entry.
+SHORTCUT_SLOTS = (
+    ("new_tab", "new_tab"),
+    ("close_tab", "close_current_tab_index"),
+    ("close_browser", "close_browser"),
+)
+
+
+def log_level_from_env() -> int:
+    """
+    Return the logging level selected by the environment.
+    LIBREX_DEBUG forces DEBUG; otherwise LIBREX_LOG names a level
+    (WARNING by default).
+    """
+    if os.environ.get("LIBREX_DEBUG"):
+        return logging.DEBUG
+    name = os.environ.get("LIBREX_LOG", "WARNING").upper()
+    return logging.getLevelNamesMapping().get(name, logging.WARNING)
+
 
 def global_exception_hook(exctype, value, tb):
     """Global hook for unhandled exceptions."""
-    logging.exception("Unhandled exception", exc_info=(exctype, value, tb))
+    logger.exception("Unhandled exception", exc_info=(exctype, value, tb))
     sys.__excepthook__(exctype, value, tb)
 
 
 sys.excepthook = global_exception_hook
 
+# Dotted URL bar input without an http(s) scheme, e.g. "example.com".
+_NEEDS_SCHEME_RE = re.compile(r"^(?!https?://)\S*\.\S*$", re.IGNORECASE)
 
-class WorkerSignals(QObject):
+
+def _preload(paths):
     """
-    Signals to be used with worker threads.
+    Ask the kernel to start reading files needed during startup.
+    Does nothing on platforms without posix_fadvise.
     """
-    result = Signal(QUrl, int)
-    error = Signal(str, int)
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug("Could not preload %s: %s", path, e)
 
-    def emit_result(self, url: QUrl, nav_id: int):
-        """Emit the result signal with a URL and navigation ID."""
-        self.result.emit(url, nav_id)
 
-    def emit_error(self, message: str, nav_id: int):
-        """Emit the error signal with an error message and navigation ID."""
-        self.error.emit(message, nav_id)
+_preload((SEARCH_ENGINE_CONFIG_PATH, STYLESHEET_PATH, FAVICON_PATH))
 
-    def reset(self):
-        """
-        Returns a tuple of signals.
-        """
-        return (self.result, self.error)
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path: str) -> str:
+    """Return the contents of a UTF-8 text file, cached per path."""
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
 
 
-class NavigationTask(QRunnable):
+@functools.lru_cache(maxsize=16)
+def load_config(path: str) -> MappingProxyType:
     """
-    Task to process a navigation request.
-    Validates and adjusts a URL; emits either a result or an error.
+    Parse a key=value config file into a read-only mapping.
+    Results are cached per path, so each file is read at most once.
     """
-    def __init__(self, url_str: str, nav_id: int):
-        super().__init__()
-        self.url_str = url_str
-        self.nav_id = nav_id
-        self.signals = WorkerSignals()
-
-    def run(self):
-        """Run the navigation task to validate and adjust the URL."""
-        if not isinstance(self.url_str, str):
-            error_msg = "url_str is not a string"
-            logging.error("%s", error_msg)
-            self.signals.emit_error(error_msg, self.nav_id)
-            return
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except (OSError, IOError) as e:
+        logger.error("Failed to load config from %s: %s", path, e)
+        return MappingProxyType({})
+    config = {}
+    for line in data.splitlines():
+        # Blank and comment lines are skipped before anything is decoded.
+        if not line or line[:1] == b"#":
+            continue
+        key, sep, value = line.partition(b"=")
+        key = key.strip()
+        value = value.strip()
+        if sep and key and value and not key.startswith(b"#"):
+            config[key.decode("utf-8")] = value.decode("utf-8")
+    return MappingProxyType(config)
+
+
+class Config:
+    """
+    Browser settings, read from the config files on first access.
+    """
+    @functools.cached_property
+    def search_engine(self) -> str:
+        """URL of the search engine home page."""
+        return load_config(SEARCH_ENGINE_CONFIG_PATH).get(
+            "default_search_engine", DEFAULT_SEARCH_ENGINE
+        )
 
-        url = QUrl(self.url_str)
-        if not url.isValid() or url.scheme() == "":
-            url = QUrl("".join([
-                DEFAULT_SEARCH_ENGINE,
-                DEFAULT_SEARCH_ENGINE_SEARCH_PATH,
-                self.url_str
-            ]))
-        self.signals.emit_result(url, self.nav_id)
+    @functools.cached_property
+    def search_path(self) -> str:
+        """Path appended to the search engine URL before a query."""
+        return load_config(SEARCH_ENGINE_CONFIG_PATH).get(
+            "default_search_engine_search_path",
+            DEFAULT_SEARCH_ENGINE_SEARCH_PATH
+        )
 
-    def get_task_info(self):
-        """
-        Return a string describing this NavigationTask.
-        """
-        return f"NavigationTask(url_str={self.url_str}, nav_id={self.nav_id})"
+    @functools.cached_property
+    def search_prefix(self) -> str:
+        """Search URL that a query is appended to."""
+        return f"{self.search_engine}{self.search_path}"
+
+
+CONFIG = Config()
+
+
+def resolve_url(url_str: str, search_prefix: str = None) -> QUrl:
+    """
+    Turn URL bar input into a QUrl.
+    Input without a valid scheme becomes a search engine query.
+    """
+    if search_prefix is None:
+        search_prefix = CONFIG.search_prefix
+    # A scheme needs a ":", so plain queries skip parsing the input as a URL.
+    if ":" in url_str:
+        url = QUrl(url_str)
+        if url.isValid() and url.scheme() != "":
+            return url
+    return QUrl(search_prefix + url_str)
+
+
+@functools.lru_cache(maxsize=256)
+def truncate_title(title: str, max_length: int = MAX_TITLE_LENGTH) -> str:
+    """
+    Truncate a title to the specified maximum length.
+    Returns the original title if shorter than max_length.
+    """
+    return (title if len(title) <= max_length
+            else f"{title[:max_length]}\u2026")
 
 
-class Browser(QMainWindow):
+def plus_button_bounds(qt_app: QApplication) -> tuple:
+    """
+    Return ((min_w, min_h), (max_w, max_h)) for the new-tab button,
+    scaled to the primary screen.
+    """
+    screen_geom = qt_app.primaryScreen().geometry()
+    screen_width = screen_geom.width()
+    screen_height = screen_geom.height()
+    return (
+        (int(screen_width * 0.0175), int(screen_height * 0.0175)),
+        (int(screen_width * 0.025), int(screen_height * 0.025)),
+    )
+
+
+class Browser(QMainWindow):  # pylint: disable=too-many-instance-attributes
     """
     Main browser window with tabs, a URL bar, a progress bar, and navigation.
     """
-    def __init__(self):
-        """Initialize the browser window and set up its components."""
+    # Built on first use, since QIcon needs a QApplication, then shared.
+    _icon = None
+
+    def __init__(self, button_bounds: tuple = None):
+        """
+        Initialize the browser window and set up its components.
+
+        :param button_bounds: ((min_w, min_h), (max_w, max_h)) for the new-tab
+            button, as returned by plus_button_bounds; computed if omitted
+        """
         super().__init__()
+        self._button_bounds = button_bounds
         self.current_navigation_id = 0
-        self.threadpool = QThreadPool.globalInstance()
+        self._pending_url = None
+        self._pending_progress = 0
+        self._current_browser = None
+        self._profile = None
+        self._tab_index = {}
         self.shortcuts = []
         self.setup_shortcuts()
-        self.setup_ui()
+        self.setup_widgets()
+        self.setup_layout()
 
     def setup_shortcuts(self):
         """Set up the keyboard shortcuts and store them."""
-        new_tab_sc = QShortcut(
-            QKeySequence(SHORTCUTS.get("new_tab", "Ctrl+T")), self
-        )
-        new_tab_sc.activated.connect(self.new_tab)
-        self.shortcuts.append(new_tab_sc)
-
-        close_tab_sc = QShortcut(
-            QKeySequence(SHORTCUTS.get("close_tab", "Ctrl+W")), self
-        )
-        close_tab_sc.activated.connect(self.close_current_tab_index)
-        self.shortcuts.append(close_tab_sc)
-
-        close_browser_sc = QShortcut(
-            QKeySequence(SHORTCUTS.get("close_browser", "Ctrl+Shift+W")), self
-        )
-        close_browser_sc.activated.connect(self.close_browser)
-        self.shortcuts.append(close_browser_sc)
+        for name, slot_name in SHORTCUT_SLOTS:
+            shortcut = QShortcut(QKeySequence(SHORTCUTS[name]), self)
+            shortcut.activated.connect(getattr(self, slot_name))
+            self.shortcuts.append(shortcut)
 
-    def setup_ui(self):
-        """Set up the user interface elements of the browser."""
+    def setup_widgets(self):
+        """Create the browser's widgets and open the first tab."""
         self.setWindowTitle("LibreXWebBrowser")
-        self.setWindowIcon(QIcon("browser/assets/icons/favicons/favicon.ico"))
+        if Browser._icon is None:
+            Browser._icon = QIcon(FAVICON_PATH)
+        self.setWindowIcon(Browser._icon)
 
         self.url_bar = QLineEdit()
         self.url_bar.setPlaceholderText("Enter URL or search query")
         self.url_bar.returnPressed.connect(self.on_url_entered)
-        self.load_stylesheet("browser/styles/stylesheets/qss/styles.qss")
+        # Redirect chains emit urlChanged several times in quick succession;
+        # only the last URL is written to the bar.
+        self._url_bar_timer = QTimer(self)
+        self._url_bar_timer.setSingleShot(True)
+        self._url_bar_timer.setInterval(50)
+        self._url_bar_timer.timeout.connect(self._flush_url_bar)
+        self.load_stylesheet(STYLESHEET_PATH)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximum(100)
         self.progress_bar.hide()
+        self._hide_progress_timer = QTimer(self)
+        self._hide_progress_timer.setSingleShot(True)
+        self._hide_progress_timer.setInterval(500)
+        self._hide_progress_timer.timeout.connect(self.progress_bar.hide)
+        # loadProgress can fire far faster than the bar needs repainting;
+        # apply at most one value per 30 ms.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(30)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.setMovable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_current_tab)
+        self.tab_widget.tabBar().tabMoved.connect(self._reindex_tabs)
         self.tab_widget.currentChanged.connect(self.current_tab_changed)
 
         self.plus_button = QPushButton("+")
-        qt_app = QApplication.instance()
-        if qt_app is None:
-            raise RuntimeError("No QApplication instance available")
-        screen_geom = qt_app.primaryScreen().geometry()
-        screen_width = screen_geom.width()
-        screen_height = screen_geom.height()
-        min_width = int(screen_width * 0.0175)
-        min_height = int(screen_height * 0.0175)
-        max_width = int(screen_width * 0.025)
-        max_height = int(screen_height * 0.025)
-        self.plus_button.setMinimumSize(min_width, min_height)
-        self.plus_button.setMaximumSize(max_width, max_height)
+        if self._button_bounds is None:
+            qt_app = QApplication.instance()
+            if qt_app is None:
+                raise RuntimeError("No QApplication instance available")
+            self._button_bounds = plus_button_bounds(qt_app)
+        min_size, max_size = self._button_bounds
+        self.plus_button.setMinimumSize(*min_size)
+        self.plus_button.setMaximumSize(*max_size)
         self.plus_button.clicked.connect(self.new_tab)
         self.tab_widget.setCornerWidget(self.plus_button, Qt.TopRightCorner)
 
         self.new_tab()
 
+    def setup_layout(self):
+        """Arrange the widgets in the main window."""
         central_widget = QWidget()
         layout = QVBoxLayout()
         layout.addWidget(self.url_bar)
@@ -185,57 +298,69 @@ class Browser(QMainWindow):
         """Close the browser window."""
         self.close()
 
-    def set_csp_header(self):
+    def _web_profile(self):
         """
-        Set the Content Security Policy header for the current web view.
-        (Uses self.web_view if it exists.)
+        Return the profile shared by every tab, creating it on first use.
+        Like Qt's default profile it is off-the-record.
         """
-        csp_header = "Content-Security-Policy: default-src 'self'; script-src 'self'; style-src 'self'; img-src 'self'; font-src 'self'; connect-src 'self'; frame-src 'self'; object-src 'none'; base-uri 'self'; form-action 'self'; upgrade-insecure-requests; block-all-mixed-content; frame-ancestors 'none'; worker-src 'self'; manifest-src 'self'; require-sri-for script style; require-trusted-types-for 'script'"
-
-        if hasattr(self, "web_view") and self.web_view is not None:
-            self.web_view.page().profile().setHttpUserAgent(csp_header)
-            self.web_view.page().profile().setHttpHeader(
-                "Content-Security-Policy", csp_header.encode("utf-8")
-            )
+        if self._profile is None:
+            # pylint: disable-next=import-outside-toplevel,no-name-in-module
+            from PySide6.QtWebEngineCore import QWebEngineProfile
+            # Parented to the tab widget, whose page stack is older, so the
+            # tabs' pages are destroyed before the profile they use.
+            self._profile = QWebEngineProfile(self.tab_widget)
+        return self._profile
 
     def load_stylesheet(self, path):
         """
         Load a stylesheet from the given file path and apply it.
         """
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                stylesheet = file.read()
-            self.setStyleSheet(stylesheet)
+            self.setStyleSheet(_read_text(path))
         except (OSError, IOError) as e:
-            logging.error("Failed to load stylesheet from %s: %s", path, e)
+            logger.error("Failed to load stylesheet from %s: %s", path, e)
 
     def new_tab(self, url: str = None, label: str = "New Tab", switch: bool = True):
         """
         Open a new tab with an optional URL and label.
         
-        :param url: URL to load (defaults to DEFAULT_SEARCH_ENGINE)
+        :param url: URL to load (defaults to the configured search engine)
         :param label: Label for the tab
         :param switch: Whether to immediately switch to the new tab
         """
+        # QtWebEngineWidgets pulls in the Chromium bindings, so it is only
+        # imported once the first tab actually needs a view.
+        # pylint: disable-next=import-outside-toplevel,no-name-in-module
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+
         web_view = None
         try:
-            web_view = QWebEngineView()
-            web_view.loadStarted.connect(self.on_load_started)
-            web_view.loadProgress.connect(self.on_load_progress)
-            web_view.loadFinished.connect(self.on_load_finished)
-            url_obj = QUrl(url) if url else QUrl(DEFAULT_SEARCH_ENGINE)
+            web_view = QWebEngineView(self._web_profile())
+            # Views live on the GUI thread, so skip AutoConnection's
+            # per-emit thread check.
+            web_view.loadStarted.connect(
+                self.on_load_started, Qt.DirectConnection
+            )
+            web_view.loadProgress.connect(
+                self.on_load_progress, Qt.DirectConnection
+            )
+            web_view.loadFinished.connect(
+                self.on_load_finished, Qt.DirectConnection
+            )
+            url_obj = QUrl(url) if url else QUrl(CONFIG.search_engine)
             web_view.setUrl(url_obj)
             index = self.tab_widget.addTab(web_view, label)
+            self._reindex_tabs()
             if switch:
                 self.tab_widget.setCurrentIndex(index)
             web_view.urlChanged.connect(
-                lambda qurl, wv=web_view: self._safe_update_url_bar(qurl, wv)
+                self._on_url_changed, Qt.DirectConnection
             )
-            web_view.loadFinished.connect(
-                lambda _, wv=web_view: self._safe_update_tab_title(wv)
+            web_view.titleChanged.connect(
+                self._on_title_changed, Qt.DirectConnection
             )
         except (RuntimeError, AttributeError) as e:
-            logging.error("Error creating a new tab: %s", e)
+            logger.error("Error creating a new tab: %s", e)
             if web_view is not None:
                 web_view.deleteLater()
 
@@ -244,27 +369,41 @@ class Browser(QMainWindow):
         current_index = self.tab_widget.currentIndex()
         self.close_current_tab(current_index)
 
-    def _safe_update_url_bar(self, qurl: QUrl, browser: QWebEngineView):
-        """Internal helper to update the URL bar for a browser view."""
-        self.update_url_bar(qurl, browser)
-
-    def _safe_update_tab_title(self, browser: QWebEngineView):
-        """Internal helper to update the tab title for a browser view."""
-        self.update_tab_title(browser)
+    @Slot(QUrl)
+    def _on_url_changed(self, qurl: QUrl):
+        """Forward a view's urlChanged signal to update_url_bar."""
+        self.update_url_bar(qurl, self.sender())
 
     def close_current_tab(self, index: int):
         """Close the tab at the specified index."""
         if self.tab_widget.count() > 1:
             try:
                 self.tab_widget.removeTab(index)
+                self._reindex_tabs()
             except (RuntimeError, AttributeError) as e:
-                logging.error("Failed to remove tab at index %s: %s", index, e)
+                logger.error("Failed to remove tab at index %s: %s", index, e)
         else:
             self.close_browser()
 
+    @Slot()
+    def _reindex_tabs(self):
+        """
+        Rebuild the view-to-index map after tabs are added, closed or moved,
+        so per-view slots look up their tab without a linear indexOf scan.
+        """
+        self._tab_index = {
+            self.tab_widget.widget(index): index
+            for index in range(self.tab_widget.count())
+        }
+
+    @Slot(int)
     def current_tab_changed(self, index: int):
         """Update the URL bar when the current tab changes."""
+        self._url_bar_timer.stop()
+        self._pending_url = None
+        self._progress_timer.stop()
         current_browser = self.tab_widget.widget(index)
+        self._current_browser = current_browser
         if current_browser:
             self.url_bar.setText(current_browser.url().toString())
         else:
@@ -280,99 +419,107 @@ class Browser(QMainWindow):
 
         self.current_navigation_id += 1
         current_id = self.current_navigation_id
-        user_input_lower = user_input.lower()
-        if (not user_input_lower.startswith(("http://", "https://"))
-                and "." in user_input):
-            user_input = "".join(["https://", user_input])
-        try:
-            task = NavigationTask(user_input, current_id)
-            task.signals.result.connect(self.on_navigation_result)
-            task.signals.error.connect(self.on_navigation_error)
-            self.threadpool.start(task)
-            logging.debug("Started navigation task for '%s' with id %s.",
-                          user_input, current_id)
-        except (RuntimeError, AttributeError) as e_navigation_task:
-            logging.debug("Error occured during navigation: %s", e_navigation_task)
+        if _NEEDS_SCHEME_RE.match(user_input):
+            user_input = f"https://{user_input}"
+        # Resolving a QUrl takes microseconds, so it runs inline rather than
+        # paying for a thread pool hop and queued signals.
+        self.on_navigation_result(resolve_url(user_input), current_id)
 
     def on_navigation_result(self, url: QUrl, nav_id: int):
         """Handle a successful navigation result."""
         if nav_id != self.current_navigation_id:
-            logging.debug("Ignoring outdated navigation (id %s).", nav_id)
+            logger.debug("Ignoring outdated navigation (id %s).", nav_id)
             return
 
-        logging.debug("Navigation result received: %s (id %s).",
-                      url.toString(), nav_id)
-        current_browser = self.tab_widget.currentWidget()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Navigation result received: %s (id %s).",
+                         url.toString(), nav_id)
+        current_browser = self._current_browser
         if current_browser:
             try:
                 current_browser.stop()
-            except (RuntimeError, AttributeError) as e:
-                logging.warning("Error stopping current browser load: %s", e)
-            try:
                 current_browser.setUrl(url)
             except (RuntimeError, AttributeError) as e:
-                logging.error("Failed to set URL for current browser: %s", e)
+                logger.error("Failed to load URL in current browser: %s", e)
         else:
-            logging.error("No active browser tab available to load the URL.")
-
-    def on_navigation_error(self, error_message: str, nav_id: int):
-        """Log navigation errors."""
-        logging.error("Navigation error (id %s): %s", nav_id, error_message)
+            logger.error("No active browser tab available to load the URL.")
 
     def update_url_bar(self, qurl: QUrl, browser: QWebEngineView):
-        """Update the URL bar if the given browser view is active."""
-        if self.tab_widget.currentWidget() == browser:
-            self.url_bar.setText(qurl.toString())
-
-    def truncate_title(self, title, max_length=15):
         """
-        Truncate a title to the specified maximum length.
-        Returns the original title if shorter than max_length.
+        Schedule a URL bar update if the given browser view is active.
         """
-        if len(title) <= max_length:
-            return title
-        return "".join([title[:max_length], "..."])
-
-    def update_tab_title(self, browser: QWebEngineView):
+        if browser is self._current_browser:
+            self._pending_url = qurl
+            self._url_bar_timer.start()
+
+    @Slot()
+    def _flush_url_bar(self):
+        """Write the most recent pending URL to the URL bar."""
+        if self._pending_url is not None:
+            self.url_bar.setText(self._pending_url.toString())
+            self._pending_url = None
+
+    @Slot(str)
+    def _on_title_changed(self, title: str):
         """
-        Update the tab title based on the browser view's title or URL.
+        Update the tab title from the view's titleChanged signal.
+        Falls back to the view's URL while the page has no title.
         """
-        index = self.tab_widget.indexOf(browser)
+        browser = self.sender()
+        index = self._tab_index.get(browser, -1)
         if index == -1:
             return
-        title = browser.page().title()
         if title:
-            truncated = self.truncate_title(title)
+            truncated = truncate_title(title)
             self.tab_widget.setTabText(index, truncated)
         else:
             self.tab_widget.setTabText(index, browser.url().toString())
 
+    @Slot()
     def on_load_started(self):
         """Show the progress bar when a page starts loading."""
-        if self.sender() == self.tab_widget.currentWidget():
+        if self.sender() is self._current_browser:
+            self._hide_progress_timer.stop()
             self.progress_bar.show()
 
+    @Slot(int)
     def on_load_progress(self, progress: int):
-        """Update the progress bar as the page loads."""
-        if self.sender() == self.tab_widget.currentWidget():
-            self.progress_bar.setValue(progress)
-
+        """Schedule a progress bar update as the page loads."""
+        if self.sender() is self._current_browser:
+            self._pending_progress = progress
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+
+    @Slot()
+    def _flush_progress(self):
+        """Apply the most recent pending load progress to the progress bar."""
+        self.progress_bar.setValue(self._pending_progress)
+
+    @Slot()
     def on_load_finished(self):
         """
         Finish the page load by setting progress to 100 and hiding the progress bar.
         """
-        if self.sender() == self.tab_widget.currentWidget():
+        if self.sender() is self._current_browser:
+            self._progress_timer.stop()
             self.progress_bar.setValue(100)
-            QTimer.singleShot(500, self.progress_bar.hide)
+            self._hide_progress_timer.start()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=log_level_from_env(),
+        format="%(asctime)s [%(levelname)-8s] %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    # Required by QtWebEngine when it is imported after QApplication exists.
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     try:
         app = QApplication(sys.argv)
-        window = Browser()
+        window = Browser(plus_button_bounds(app))
         window.showMaximized()
         sys.exit(app.exec())
     except (RuntimeError, AttributeError) as e_app_init:
-        logging.critical("An error occurred while initializing the application: %s",
-                         e_app_init)
+        logger.critical("An error occurred while initializing the application: %s",
+                        e_app_init)
         sys.exit(1)